@@ -18,13 +18,23 @@ def _alert(msg, title='Create Link Button'):
     except Exception:
         pass
 
+# forbidden filename chars -> NUL sentinel via str.translate (one C-level
+# pass, no per-call regex cache hit); a precompiled pattern then collapses
+# each sentinel run into a single '_'. The sentinel can't appear in input,
+# so underscores the user typed are left alone.
+_FORBIDDEN = dict.fromkeys(map(ord, u'<>:"/\\|?*\r\n'), u'\x00')
+_BAD_RUN   = re.compile(u'\x00+')
+
 def _safe_name(name):
-    s = re.sub(r'[<>:"/\\|?*\r\n]+', '_', (name or '').strip())
+    s = _BAD_RUN.sub('_', (name or u'').strip().translate(_FORBIDDEN))
     return s or 'Link Button'
 
+# longest prefix is 'https://' (8 chars) — lowercasing only that slice keeps
+# the check O(1) however long the target string is
+_URL_PREFIXES = ('http://', 'https://', 'mailto:')
+
 def _is_url(s):
-    s = (s or '').strip().lower()
-    return s.startswith('http://') or s.startswith('https://') or s.startswith('mailto:')
+    return (s or '').strip()[:8].lower().startswith(_URL_PREFIXES)
 
 def _classify_target(target_text):
     """Return 'url' | 'file' | 'folder' without needing the future button dir."""
@@ -69,21 +79,25 @@ def _alert(msg, title='Open Link'):
 
 def _read_target(txt_path):
     try:
-        with open(txt_path, 'r') as f:
-            for raw in f:
-                s = raw.strip()
-                if not s or s.startswith('#'):
-                    continue
-                if s.lower().startswith('url='):
-                    s = s[4:].strip()
-                return os.path.expandvars(os.path.expanduser(s))
+        # link.txt is tiny: one binary read + decode beats line iteration
+        # through the text-mode translation layer
+        with open(txt_path, 'rb') as f:
+            data = f.read(4096)
+        for raw in data.decode('utf-8', 'replace').splitlines():
+            s = raw.strip()
+            if not s or s.startswith('#'):
+                continue
+            if s.lower().startswith('url='):
+                s = s[4:].strip()
+            return os.path.expandvars(os.path.expanduser(s))
     except Exception as e:
         _alert('Could not read:\n{}\n\n{}'.format(txt_path, e))
     return None
 
+_URL_PREFIXES = ('http://', 'https://', 'mailto:')
+
 def _is_url(s):
-    s = (s or '').lower()
-    return s.startswith('http://') or s.startswith('https://') or s.startswith('mailto:')
+    return (s or '')[:8].lower().startswith(_URL_PREFIXES)
 
 def main():
     bundle_dir = os.path.dirname(os.path.abspath(__file__))
@@ -203,6 +217,9 @@ def _get_inputs_with_ui(xaml_path):
         _alert('Could not open UI.\n{}'.format(e), 'UI Error'); return None, None, False
 
 # -------- Ribbon helpers (fallback injection only if reload fails) --------
+_tab_panel_index    = {}   # id(tab)   -> {lowered panel title: panel}
+_panel_button_names = {}   # id(panel) -> set of lowered button texts
+
 def _panel_and_tab(tab_title, panel_titles):
     try:
         import clr
@@ -216,13 +233,18 @@ def _panel_and_tab(tab_title, panel_titles):
             if ((t.Title or '').strip().lower() == ttitle) or ((getattr(t, 'Id', '') or '').strip().lower() == ttitle):
                 tab = t; break
         if tab is None: return None, None
-        # try each desired title; if none found, fall back to first panel
-        for want in panel_titles:
-            w = (want or '').strip().lower()
+        # title -> panel index, built once per tab (avoids rescanning
+        # tab.Panels for every desired title / repeated injection)
+        index = _tab_panel_index.get(id(tab))
+        if index is None:
+            index = {}
             for p in tab.Panels:
-                title = getattr(p.Source, 'Title', '') or ''
-                if title.strip().lower() == w:
-                    return tab, p
+                index[(getattr(p.Source, 'Title', '') or '').strip().lower()] = p
+            _tab_panel_index[id(tab)] = index
+        for want in panel_titles:
+            p = index.get((want or '').strip().lower())
+            if p is not None:
+                return tab, p
         # fallback
         return tab, tab.Panels[0] if tab.Panels.Count > 0 else (tab, None)
     except Exception:
@@ -230,9 +252,13 @@ def _panel_and_tab(tab_title, panel_titles):
 
 def _panel_has_button(panel, label):
     try:
-        for it in list(panel.Source.Items):
-            if (getattr(it, 'Text', None) or '').strip().lower() == (label or '').strip().lower():
-                return True
+        names = _panel_button_names.get(id(panel))
+        if names is None:
+            names = set()
+            for it in panel.Source.Items:
+                names.add((getattr(it, 'Text', None) or '').strip().lower())
+            _panel_button_names[id(panel)] = names
+        return (label or '').strip().lower() in names
     except Exception:
         pass
     return False
@@ -274,7 +300,7 @@ def _inject_ribbon_button(tab_title, desired_panel_title, label, btn_dir):
                         tgt = os.path.expandvars(os.path.expanduser(s)); break
                 if not tgt:
                     _alert('Missing/empty link.txt.\nPut a URL or file path on the first non-empty line.', 'Open Link'); return
-                is_url = (tgt.lower().startswith('http://') or tgt.lower().startswith('https://') or tgt.lower().startswith('mailto:'))
+                is_url = tgt[:8].lower().startswith(_URL_PREFIXES)
                 if not is_url and not os.path.isabs(tgt):
                     tgt = os.path.abspath(os.path.join(self._bdir, tgt))
                 os.startfile(tgt)
@@ -293,26 +319,38 @@ def _inject_ribbon_button(tab_title, desired_panel_title, label, btn_dir):
             pass
 
     try:
-        panel.Source.Items.Add(btn); return True
+        panel.Source.Items.Add(btn)
+        names = _panel_button_names.get(id(panel))
+        if names is not None:
+            names.add((label or '').strip().lower())  # keep the index current
+        return True
     except Exception:
         return False
 
 # -------- your proven pyRevit auto-reload --------
+_PYREVIT_EXE = [None]   # memoized pyrevit.exe path — probe the candidates once per session
+# constant across calls — build the hidden-window STARTUPINFO once
+try:
+    _SI = subprocess.STARTUPINFO()
+    _SI.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+except Exception:
+    _SI = None
+
 def _autoreload_pyrevit():
     try:
         from pyrevit.loader import sessionmgr
         sessionmgr.reload_pyrevit(); return True
     except Exception:
         pass
-    si = None
     try:
-        si = subprocess.STARTUPINFO(); si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-    except Exception:
-        pass
-    try:
-        subprocess.Popen(['pyrevit', 'reload'], startupinfo=si, shell=False); return True
+        subprocess.Popen(['pyrevit', 'reload'], startupinfo=_SI, shell=False); return True
     except Exception:
         pass
+    if _PYREVIT_EXE[0]:
+        try:
+            subprocess.Popen([_PYREVIT_EXE[0], 'reload'], startupinfo=_SI, shell=False); return True
+        except Exception:
+            pass
     appdata  = os.environ.get('APPDATA') or ''
     localapp = os.environ.get('LOCALAPPDATA') or ''
     for exe in [
@@ -324,7 +362,8 @@ def _autoreload_pyrevit():
     ]:
         try:
             if os.path.exists(exe):
-                subprocess.Popen([exe, 'reload'], startupinfo=si, shell=False); return True
+                _PYREVIT_EXE[0] = exe
+                subprocess.Popen([exe, 'reload'], startupinfo=_SI, shell=False); return True
         except Exception:
             continue
     return False
@@ -346,24 +385,29 @@ def main():
     kind             = _classify_target(target)            # 'url' | 'file' | 'folder'
     pulldown_title   = _pulldown_title_for(kind)           # e.g. 'CustomBarURL'
 
-    # Ensure parent panel exists
-    parent_panel_dir = os.path.join(this_tab_dir, PARENT_PANEL_TITLE + '.panel')
-    if not os.path.isdir(parent_panel_dir):
-        os.makedirs(parent_panel_dir)
-
-    # Ensure pulldown exists
+    # Ensure panel + pulldown exist — makedirs creates the whole chain and
+    # the except collapses the isdir check+create into one syscall each
+    parent_panel_dir  = os.path.join(this_tab_dir, PARENT_PANEL_TITLE + '.panel')
     dest_pulldown_dir = os.path.join(parent_panel_dir, pulldown_title + '.pulldown')
-    if not os.path.isdir(dest_pulldown_dir):
+    try:
         os.makedirs(dest_pulldown_dir)
+    except OSError:
+        pass  # already there
 
-    # Unique button folder under that pulldown
-    base    = _safe_name(label)
-    btn_dir = os.path.join(dest_pulldown_dir, base + '.pushbutton')
-    if os.path.exists(btn_dir):
+    # Unique button folder under that pulldown: list the pulldown once and
+    # probe candidates against the in-memory set instead of stat'ing each
+    base = _safe_name(label)
+    try:
+        existing = set(n.lower() for n in os.listdir(dest_pulldown_dir))
+    except OSError:
+        existing = set()
+    bundle = base + '.pushbutton'
+    if bundle.lower() in existing:
         i = 2
-        while os.path.exists(os.path.join(dest_pulldown_dir, u'{} ({}).pushbutton'.format(base, i))):
+        while u'{} ({}).pushbutton'.format(base, i).lower() in existing:
             i += 1
-        btn_dir = os.path.join(dest_pulldown_dir, u'{} ({}).pushbutton'.format(base, i))
+        bundle = u'{} ({}).pushbutton'.format(base, i)
+    btn_dir = os.path.join(dest_pulldown_dir, bundle)
     os.makedirs(btn_dir)
 
     # Write files
@@ -1,13 +1,8 @@
 # coding: utf-8
 # Remove Pushbuttons — list ALL pushbuttons inside pulldown folders under THIS PANEL
 
-import os, io, shutil, subprocess
+import os, io, shutil, stat, subprocess, threading
 
-# py2/py3 text shim
-try:
-    unicode
-except NameError:
-    unicode = str
 
 def _alert(msg, title='Remove Buttons'):
     try:
@@ -27,26 +22,29 @@ def _list_pulldown_pushbuttons(panel_dir, exclude_btn_dir=None):
     Return [(display, pushbutton_dir)] for ALL .pushbutton bundles found
     inside any *.pulldown under the given panel.
     display format:  '<PulldownName>  /  <ButtonName>'
+
+    Uses one pruned os.walk so every real directory is enumerated exactly
+    once (one opendir round trip each on network shares).
     """
     items = []
+    exclude_key = os.path.normcase(os.path.normpath(exclude_btn_dir)) if exclude_btn_dir else None
     try:
-        for entry in os.listdir(panel_dir):
-            if not entry.lower().endswith('.pulldown'):
+        for root, dirs, _files in os.walk(panel_dir):
+            if root == panel_dir:
+                # depth 0: only descend into pulldown bundles
+                dirs[:] = [d for d in dirs if d.lower().endswith('.pulldown')]
                 continue
-            pd_name = os.path.splitext(entry)[0]              # e.g. 'CustomBarURL'
-            pd_dir  = os.path.join(panel_dir, entry)
-            if not os.path.isdir(pd_dir):
-                continue
-
-            for sub in os.listdir(pd_dir):
+            # depth 1: a pulldown — collect its pushbuttons, go no deeper
+            pd_name = os.path.basename(root)[:-len('.pulldown')]
+            for sub in dirs:
                 if not sub.lower().endswith('.pushbutton'):
                     continue
-                pbd = os.path.join(pd_dir, sub)
-                if exclude_btn_dir and os.path.normpath(pbd) == os.path.normpath(exclude_btn_dir):
+                pbd = os.path.join(root, sub)
+                if exclude_key and os.path.normcase(os.path.normpath(pbd)) == exclude_key:
                     continue  # don't list this remover itself (in case it lives in a pulldown)
-                btn_name = os.path.splitext(sub)[0]
-                display  = u'{}  /  {}'.format(pd_name, btn_name)
-                items.append((display, pbd))
+                btn_name = sub[:-len('.pushbutton')]
+                items.append((u'{}  /  {}'.format(pd_name, btn_name), pbd))
+            dirs[:] = []
     except Exception:
         pass
 
@@ -54,21 +52,29 @@ def _list_pulldown_pushbuttons(panel_dir, exclude_btn_dir=None):
     return items
 
 # ---------- your proven pyRevit auto-reload ----------
+_PYREVIT_EXE = [None]   # memoized pyrevit.exe path — probe the candidates once per session
+# constant across calls — build the hidden-window STARTUPINFO once
+try:
+    _SI = subprocess.STARTUPINFO()
+    _SI.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+except Exception:
+    _SI = None
+
 def _autoreload_pyrevit():
     try:
         from pyrevit.loader import sessionmgr
         sessionmgr.reload_pyrevit(); return True
     except Exception:
         pass
-    si = None
-    try:
-        si = subprocess.STARTUPINFO(); si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-    except Exception:
-        pass
     try:
-        subprocess.Popen(['pyrevit', 'reload'], startupinfo=si, shell=False); return True
+        subprocess.Popen(['pyrevit', 'reload'], startupinfo=_SI, shell=False); return True
     except Exception:
         pass
+    if _PYREVIT_EXE[0]:
+        try:
+            subprocess.Popen([_PYREVIT_EXE[0], 'reload'], startupinfo=_SI, shell=False); return True
+        except Exception:
+            pass
     appdata  = os.environ.get('APPDATA') or ''
     localapp = os.environ.get('LOCALAPPDATA') or ''
     for exe in [
@@ -80,18 +86,33 @@ def _autoreload_pyrevit():
     ]:
         try:
             if os.path.exists(exe):
-                subprocess.Popen([exe, 'reload'], startupinfo=si, shell=False); return True
+                _PYREVIT_EXE[0] = exe
+                subprocess.Popen([exe, 'reload'], startupinfo=_SI, shell=False); return True
         except Exception:
             continue
     return False
 
 # ---------- WPF UI (same ui.xaml as before) ----------
+class _RowItem(object):
+    """ListBox row: renders the display text, carries the bundle path so
+    selection hands paths back directly — no display->path dict, and
+    duplicate display strings across pulldowns can't collide."""
+    __slots__ = ('display', 'path')
+
+    def __init__(self, display, path):
+        self.display = display
+        self.path = path
+
+    def __str__(self):
+        return self.display
+
 def _show_ui(xaml_path, items):
     try:
         import clr
         clr.AddReference('PresentationFramework'); clr.AddReference('WindowsBase')
         from pyrevit import forms
         import System
+        from System.Collections.Generic import List
 
         class Dialog(forms.WPFWindow):
             def __init__(self, xaml, items_in):
@@ -102,8 +123,12 @@ def _show_ui(xaml_path, items):
 
                 if self.RemoveList is not None:
                     self.RemoveList.SelectionMode = System.Windows.Controls.SelectionMode.Extended
-                    for disp, _ in items_in:
-                        self.RemoveList.Items.Add(disp)
+                    # single ItemsSource assignment instead of per-item Items.Add
+                    # (one measure/arrange pass; virtualization set in ui.xaml)
+                    src = List[System.Object]()
+                    for disp, pth in items_in:
+                        src.Add(_RowItem(disp, pth))
+                    self.RemoveList.ItemsSource = src
 
                 if self.RemoveBtn is not None: self.RemoveBtn.Click += self._ok
                 if self.CancelBtn is not None: self.CancelBtn.Click += self._cancel
@@ -122,8 +147,9 @@ def _show_ui(xaml_path, items):
                 except Exception: pass
 
             def _ok(self, s, a):
-                sels = list(self.RemoveList.SelectedItems) if self.RemoveList is not None else []
-                self.result = [unicode(x) for x in sels] if sels else []
+                # one pass over the WPF selection — rows carry their paths
+                self.result = ([x.path for x in self.RemoveList.SelectedItems]
+                               if self.RemoveList is not None else [])
                 self.Close()
 
             def _cancel(self, s, a):
@@ -138,13 +164,48 @@ def _show_ui(xaml_path, items):
     except Exception as e:
         _alert('Could not open UI.\n{}'.format(e), 'UI Error'); return None
 
+def _rmtree_force(path):
+    # clear read-only bits on failure so one rmtree pass suffices
+    def _onerror(func, p, exc_info):
+        os.chmod(p, stat.S_IWRITE)
+        func(p)
+    shutil.rmtree(path, onerror=_onerror)
+
 def _remove_dirs(paths):
+    """Delete bundle folders; rmtree is unlink-syscall-bound (worse under
+    virus scanners), so overlap the I/O with a few worker threads."""
     ok, failed = [], []
-    for p in paths:
+
+    def _remove_one(p):
         try:
-            shutil.rmtree(p); ok.append(p)
+            _rmtree_force(p)
+            with lock:
+                ok.append(p)
         except Exception as e:
-            failed.append((p, str(e)))
+            with lock:
+                failed.append((p, str(e)))
+
+    lock = threading.Lock()
+    if len(paths) <= 1:
+        for p in paths:
+            _remove_one(p)
+        return ok, failed
+
+    pending = list(paths)
+
+    def _worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                p = pending.pop()
+            _remove_one(p)
+
+    workers = [threading.Thread(target=_worker) for _ in range(min(8, len(paths)))]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
     return ok, failed
 
 def main():
@@ -157,12 +218,11 @@ def main():
         return
 
     xaml_path = os.path.join(os.path.dirname(here), 'ui.xaml')
-    selection = _show_ui(xaml_path, items)
+    selection = _show_ui(xaml_path, items)   # list of bundle paths
     if selection is None:
         return
 
-    disp_to_path = dict(items)
-    targets = [disp_to_path.get(d) for d in selection if disp_to_path.get(d)]
+    targets = [p for p in selection if p]
     if not targets:
         return
 
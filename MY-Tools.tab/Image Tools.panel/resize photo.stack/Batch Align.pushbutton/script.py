@@ -7,6 +7,7 @@
 # - Target = frame origin + ( +14'-0" X, +15'-6" Y ).
 
 from Autodesk.Revit.DB import *
+from System.Collections.Generic import List
 
 uidoc = __revit__.ActiveUIDocument
 doc   = uidoc.Document
@@ -18,28 +19,37 @@ OFFSET_UP_FT    = 15.0 + 6.0/12.0   # 15'-6"
 EPS = 1e-9
 # ------------------------
 
-def _is_frame(fi):
-    try:
-        return isinstance(fi, FamilyInstance) and fi.Category and \
-               fi.Category.Id.IntegerValue == int(BuiltInCategory.OST_GenericAnnotation)
-    except:
-        return False
+# Hoisted constants/bindings — this predicate runs once per collected element
+# and each BuiltInParameter/attribute chain is a CLR round-trip.
+_TYPE_NAME_BIP = BuiltInParameter.ALL_MODEL_TYPE_NAME
+_get_element   = doc.GetElement
+# TypeId.IntegerValue -> is_pdf; None means the type had no usable name and
+# the per-instance name fallback must decide. Many imports share one type,
+# so this turns O(instances) parameter reads into O(distinct types).
+_pdf_type_cache = {}
 
 def _is_pdf_import(el):
     if not isinstance(el, ImportInstance):
         return False
     try:
-        typ = doc.GetElement(el.GetTypeId())
-        nm = None
-        if typ:
-            p = typ.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME)
-            if p and p.HasValue:
-                nm = p.AsString()
-            if not nm:
-                nm = getattr(typ, "Name", None)
-        if not nm:
-            nm = getattr(el, "Name", "")
-        return bool(nm) and nm.lower().endswith(".pdf")
+        key = el.GetTypeId().IntegerValue
+        if key in _pdf_type_cache:
+            cached = _pdf_type_cache[key]
+        else:
+            typ = _get_element(el.GetTypeId())
+            nm = None
+            if typ:
+                p = typ.get_Parameter(_TYPE_NAME_BIP)
+                if p and p.HasValue:
+                    nm = p.AsString()
+                if not nm:
+                    nm = getattr(typ, "Name", None)
+            cached = (nm[-4:].lower() == ".pdf") if nm else None
+            _pdf_type_cache[key] = cached
+        if cached is not None:
+            return cached
+        nm = getattr(el, "Name", "")
+        return bool(nm) and nm[-4:].lower() == ".pdf"
     except:
         return False
 
@@ -57,15 +67,21 @@ def _frame_origin(fi, v):
         return loc.Point
     return _bbox_center(fi, v)
 
-# Collect frames & photos in active view
-frames = [e for e in FilteredElementCollector(doc, view.Id).OfClass(FamilyInstance) if _is_frame(e)]
+# Collect frames & photos in active view (category check runs natively in the
+# collector instead of per-element in Python)
+frames = list(FilteredElementCollector(doc, view.Id)
+              .OfClass(FamilyInstance)
+              .OfCategory(BuiltInCategory.OST_GenericAnnotation))
 if not frames:
     # Quiet exit
     import sys; sys.exit()
 
-photos_img = list(FilteredElementCollector(doc, view.Id).OfClass(ImageInstance))
-photos_pdf = [e for e in FilteredElementCollector(doc, view.Id).OfClass(ImportInstance) if _is_pdf_import(e)]
-photos = photos_img + photos_pdf
+# One traversal of the view element table for both photo classes, instead of
+# separate ImageInstance and ImportInstance collections
+_photo_filter = LogicalOrFilter(ElementClassFilter(ImageInstance),
+                                ElementClassFilter(ImportInstance))
+photos = [e for e in FilteredElementCollector(doc, view.Id).WherePasses(_photo_filter)
+          if isinstance(e, ImageInstance) or _is_pdf_import(e)]
 if not photos:
     # Quiet exit
     import sys; sys.exit()
@@ -96,15 +112,68 @@ photos, centers = zip(*photo_centers)
 photos  = list(photos)
 centers = list(centers)
 
-# Build all pair distances (XY only), sort ascending
-pairs = []
-for i, tp in enumerate(targets):
-    for j, cp in enumerate(centers):
-        dx = tp.X - cp.X
-        dy = tp.Y - cp.Y
-        d2 = dx*dx + dy*dy
-        pairs.append((d2, i, j))
-pairs.sort(key=lambda t: t[0])
+# Candidate pair generation (XY only).
+# For small sets score every frame/photo pair; for large sets bucket the photo
+# centers on a uniform grid and only score the ~K nearest photos per frame
+# (pure-Python stand-in for a KD-tree query — scipy is not importable in
+# Revit's engine). Pairs sort ascending by squared distance.
+NEAREST_K = 8
+
+def _all_pairs(target_xy, center_xy):
+    return [((tx - cx) * (tx - cx) + (ty - cy) * (ty - cy), i, j)
+            for i, (tx, ty) in enumerate(target_xy)
+            for j, (cx, cy) in enumerate(center_xy)]
+
+def _grid_pairs(target_xy, center_xy, k):
+    # cell size ~ one photo per cell on average
+    xs = [c[0] for c in center_xy]
+    ys = [c[1] for c in center_xy]
+    span = max(max(xs) - min(xs), max(ys) - min(ys))
+    cell = span / (len(center_xy) ** 0.5)
+    if cell <= EPS:
+        return _all_pairs(target_xy, center_xy)
+
+    buckets = {}
+    for j, (cx, cy) in enumerate(center_xy):
+        buckets.setdefault((int(cx // cell), int(cy // cell)), []).append(j)
+    bxs = [b[0] for b in buckets]
+    bys = [b[1] for b in buckets]
+
+    pairs = []
+    for i, (tx, ty) in enumerate(target_xy):
+        gx, gy = int(tx // cell), int(ty // cell)
+        # probe outward in square rings until enough candidates, plus one
+        # extra ring so a corner hit can't hide a closer straight-line one
+        max_ring = max(abs(gx - bxs[0]), abs(gy - bys[0]),
+                       abs(gx - max(bxs)), abs(gy - max(bys)),
+                       abs(gx - min(bxs)), abs(gy - min(bys)))
+        found = []
+        ring = 0
+        enough_at = None
+        while ring <= max_ring:
+            for bx in range(gx - ring, gx + ring + 1):
+                for by in range(gy - ring, gy + ring + 1):
+                    if max(abs(bx - gx), abs(by - gy)) != ring:
+                        continue
+                    for j in buckets.get((bx, by), ()):
+                        cx, cy = center_xy[j]
+                        found.append(((tx - cx) * (tx - cx) + (ty - cy) * (ty - cy), i, j))
+            if enough_at is not None and ring > enough_at:
+                break
+            if enough_at is None and len(found) >= k:
+                enough_at = ring
+            ring += 1
+        found.sort()
+        pairs.extend(found[:k])
+    return pairs
+
+target_xy = [(t.X, t.Y) for t in targets]
+center_xy = [(c.X, c.Y) for c in centers]
+if len(targets) * len(centers) <= 4 * NEAREST_K * NEAREST_K:
+    pairs = _all_pairs(target_xy, center_xy)
+else:
+    pairs = _grid_pairs(target_xy, center_xy, NEAREST_K)
+pairs.sort()
 
 # Greedy one-to-one assignment
 assigned_f = set()
@@ -123,22 +192,35 @@ for d2, i, j in pairs:
 if not assignments:
     import sys; sys.exit()
 
-# Move photos (quiet)
-t = Transaction(doc, "Auto-pair frames/photos and move")
-t.Start()
+# Move photos (quiet). Photos sharing a (rounded) delta are batched into one
+# MoveElements call, so grid layouts cost a handful of API dispatches instead
+# of one per photo.
+EPS2 = EPS * EPS
+move_groups = {}   # (dx, dy, dz) rounded to 1e-6 ft -> [photo, ...]
 for i, j in assignments:
-    target_pt = targets[i]
-    photo     = photos[j]
-    center    = centers[j]
-    delta = target_pt - center
-    if delta.GetLength() <= EPS:
+    delta = targets[i] - centers[j]
+    dx, dy, dz = delta.X, delta.Y, delta.Z
+    # squared-magnitude check — skips the sqrt in GetLength() per photo
+    if dx * dx + dy * dy + dz * dz <= EPS2:
         continue
-    was_pinned = getattr(photo, "Pinned", False)
+    key = (round(dx, 6), round(dy, 6), round(dz, 6))
+    move_groups.setdefault(key, []).append(photos[j])
+
+if move_groups:
+    pinned = [p for grp in move_groups.values() for p in grp if getattr(p, "Pinned", False)]
+    t = Transaction(doc, "Auto-pair frames/photos and move")
+    t.Start()
     try:
-        if was_pinned:
-            photo.Pinned = False
-        ElementTransformUtils.MoveElement(doc, photo.Id, delta)
-    finally:
-        if was_pinned:
-            photo.Pinned = True
-t.Commit()
+        for p in pinned:
+            p.Pinned = False
+        for (dx, dy, dz), grp in move_groups.items():
+            ids = List[ElementId]([p.Id for p in grp])
+            ElementTransformUtils.MoveElements(doc, ids, XYZ(dx, dy, dz))
+        for p in pinned:
+            p.Pinned = True
+        t.Commit()
+    except Exception:
+        # discard partial moves — committing them would bake a half-done
+        # alignment into the model
+        t.RollBack()
+        raise
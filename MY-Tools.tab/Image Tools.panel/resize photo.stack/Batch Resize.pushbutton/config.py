@@ -42,20 +42,25 @@ def _save():
         _alert("Could not save settings:\n{}".format(e))
 
 # Parse "28'-6\"", 28, 28.5, 30", 30 in, 2.5', etc.
+# (patterns compiled once at load — no per-call re cache lookup)
+_RE_FT_IN   = re.compile(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*'\s*(?P<in>\d*(?:\.\d+)?)\s*\"?\s*$")
+_RE_IN      = re.compile(r"^\s*(?P<in>-?\d+(?:\.\d+)?)\s*(?:\"|in|inch|inches)\s*$")
+_RE_FT_ONLY = re.compile(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*(?:'|ft|feet|foot)\s*$")
+
 def _parse_len(s, unit='ft'):
     if s is None: return None
     t = s.strip().lower()
     if not t: return None
-    m = re.match(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*'\s*(?P<in>\d*(?:\.\d+)?)\s*\"?\s*$", t)
+    m = _RE_FT_IN.match(t)
     if m:
         ft  = float(m.group('ft') or 0)
         ins = float(m.group('in') or 0)
         return ft + ins/12.0 if unit == 'ft' else ft*12.0 + ins
-    m = re.match(r"^\s*(?P<in>-?\d+(?:\.\d+)?)\s*(?:\"|in|inch|inches)\s*$", t)
+    m = _RE_IN.match(t)
     if m:
         v = float(m.group('in'))
         return v if unit == 'in' else v/12.0
-    m = re.match(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*(?:'|ft|feet|foot)\s*$", t)
+    m = _RE_FT_ONLY.match(t)
     if m:
         v = float(m.group('ft'))
         return v if unit == 'ft' else v*12.0
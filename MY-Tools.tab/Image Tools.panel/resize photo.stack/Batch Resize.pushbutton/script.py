@@ -62,22 +62,27 @@ def _save_cfg():
         _alert("Could not save settings:\n{}".format(e))
 
 # Length parser: supports 28, 28.5, 28'-6", 28' 6", 30", 30 in, 2.5'
+# (patterns compiled once at load — no per-call re cache lookup)
+_RE_FT_IN   = re.compile(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*'\s*(?P<in>\d*(?:\.\d+)?)\s*\"?\s*$")
+_RE_IN      = re.compile(r"^\s*(?P<in>-?\d+(?:\.\d+)?)\s*(?:\"|in|inch|inches)\s*$")
+_RE_FT_ONLY = re.compile(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*(?:'|ft|feet|foot)\s*$")
+
 def _parse_length(s, default_unit='ft'):
     if s is None:
         return None
     s = s.strip().lower()
     if not s:
         return None
-    m = re.match(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*'\s*(?P<in>\d*(?:\.\d+)?)\s*\"?\s*$", s)
+    m = _RE_FT_IN.match(s)
     if m:
         ft  = float(m.group('ft') or 0)
         ins = float(m.group('in') or 0)
         return ft + ins/12.0 if default_unit == 'ft' else ft*12.0 + ins
-    m = re.match(r"^\s*(?P<in>-?\d+(?:\.\d+)?)\s*(?:\"|in|inch|inches)\s*$", s)
+    m = _RE_IN.match(s)
     if m:
         val = float(m.group('in'))
         return val if default_unit == 'in' else val/12.0
-    m = re.match(r"^\s*(?P<ft>-?\d+(?:\.\d+)?)\s*(?:'|ft|feet|foot)\s*$", s)
+    m = _RE_FT_ONLY.match(s)
     if m:
         val = float(m.group('ft'))
         return val if default_unit == 'ft' else val*12.0
@@ -138,26 +143,45 @@ else:
     target_w_ft = (_cfg.landscape_ft or DEF_LANDSCAPE_WIDTH_FT)
     target_h_ft = (_cfg.portrait_ft  or DEF_PORTRAIT_HEIGHT_FT)
 
-# Collect images (PNG/JPG/etc)
-imgs = list(FilteredElementCollector(doc, view.Id).OfClass(ImageInstance))
+# Collect images (PNG/JPG/etc) and PDFs in ONE traversal of the view element
+# table — the two OfClass collections each walked it natively.
+# PDF = ImportInstance with type/name ending in .pdf.
+# TypeId.IntegerValue -> is_pdf; None means the type had no usable name and
+# the per-instance name fallback decides. Instances usually share a handful
+# of types, so the element fetch + parameter read run once per type.
+_pdf_type_cache = {}
 
-# Collect PDFs (ImportInstance with type/name ending in .pdf)
-pdf_imps = []
-for imp in FilteredElementCollector(doc, view.Id).OfClass(ImportInstance):
+def _import_is_pdf(imp):
     try:
-        typ = doc.GetElement(imp.GetTypeId())
-        nm = None
-        p = typ.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME) if typ else None
-        if p and p.HasValue:
-            nm = p.AsString()
-        if not nm and typ:
-            nm = getattr(typ, "Name", None)
-        if not nm:
-            nm = getattr(imp, "Name", "")
-        if nm and nm.lower().endswith(".pdf"):
-            pdf_imps.append(imp)
+        key = imp.GetTypeId().IntegerValue
+        if key in _pdf_type_cache:
+            cached = _pdf_type_cache[key]
+        else:
+            typ = doc.GetElement(imp.GetTypeId())
+            nm = None
+            if typ:
+                p = typ.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME)
+                if p and p.HasValue:
+                    nm = p.AsString()
+                if not nm:
+                    nm = getattr(typ, "Name", None)
+            cached = (nm[-4:].lower() == ".pdf") if nm else None
+            _pdf_type_cache[key] = cached
+        if cached is not None:
+            return cached
+        nm = getattr(imp, "Name", "")
+        return bool(nm) and nm[-4:].lower() == ".pdf"
     except:
-        pass
+        return False
+
+_photo_filter = LogicalOrFilter(ElementClassFilter(ImageInstance),
+                                ElementClassFilter(ImportInstance))
+imgs, pdf_imps = [], []
+for el in FilteredElementCollector(doc, view.Id).WherePasses(_photo_filter):
+    if isinstance(el, ImageInstance):
+        imgs.append(el)
+    elif _import_is_pdf(el):
+        pdf_imps.append(el)
 
 if not imgs and not pdf_imps:
     _alert("No ImageInstance or PDF ImportInstance found in the active view.")
@@ -178,13 +202,21 @@ def _bbox_wh(el, v):
             (bb.Min.Z + bb.Max.Z) * 0.5)
     return w, h, c
 
+def _bbox_wh_only(el, v):
+    # _bbox_wh minus the center XYZ — the image loop never uses it, and
+    # skipping it saves one CLR allocation per image
+    bb = el.get_BoundingBox(v)
+    if not bb:
+        return None, None
+    return max(0.0, bb.Max.X - bb.Min.X), max(0.0, bb.Max.Y - bb.Min.Y)
+
 t = Transaction(doc, "Auto-resize images by orientation")
 t.Start()
 
 # --- ImageInstance: bbox-based RELATIVE scaling (rotation-aware) ---
 for el in imgs:
     try:
-        w_bb, h_bb, _ = _bbox_wh(el, view)
+        w_bb, h_bb = _bbox_wh_only(el, view)
         if not w_bb or not h_bb or (w_bb <= EPS and h_bb <= EPS):
             continue
 
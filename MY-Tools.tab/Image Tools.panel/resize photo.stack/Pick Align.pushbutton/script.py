@@ -17,20 +17,19 @@ OFFSET_RIGHT_FT = 14.0              # +X (right)
 OFFSET_UP_FT    = 15.0 + 6.0/12.0   # +Y (up) = 15'-6"
 # --------------------------
 
+# AllowElement fires for every element the cursor touches during a pick, so
+# the category ids are resolved once here instead of per hover callback
+_GA_ID           = int(BuiltInCategory.OST_GenericAnnotation)
+_ALLOWED_CAT_IDS = frozenset((_GA_ID, int(BuiltInCategory.OST_DetailComponents)))
+
 class FrameSelFilter(ISelectionFilter):
     def AllowElement(self, e):
         try:
             cat = e.Category
-            if cat and cat.Id.IntegerValue in (
-                int(BuiltInCategory.OST_GenericAnnotation),
-                int(BuiltInCategory.OST_DetailComponents)
-            ):
-                return True
-            if isinstance(e, Group):
-                return True
+            return (cat is not None and cat.Id.IntegerValue in _ALLOWED_CAT_IDS) \
+                   or isinstance(e, Group)
         except:
-            pass
-        return False
+            return False
     def AllowReference(self, ref, pt):
         return False
 
@@ -65,7 +64,7 @@ def frame_origin(frame_el, v):
                 mem = doc.GetElement(mid)
                 if isinstance(mem, FamilyInstance):
                     cat = mem.Category
-                    if cat and cat.Id.IntegerValue == int(BuiltInCategory.OST_GenericAnnotation):
+                    if cat and cat.Id.IntegerValue == _GA_ID:
                         loc = mem.Location
                         if isinstance(loc, LocationPoint):
                             return loc.Point
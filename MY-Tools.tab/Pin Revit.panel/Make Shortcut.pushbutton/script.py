@@ -196,6 +196,14 @@ def _list_existing_shortcuts_in_pulldowns():
     return items
 
 # ---------- auto-reload ----------
+_PYREVIT_EXE = [None]   # memoized pyrevit.exe path — probe the candidates once per session
+# constant across calls — build the hidden-window STARTUPINFO once
+try:
+    _SI = subprocess.STARTUPINFO()
+    _SI.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+except Exception:
+    _SI = None
+
 def _autoreload_pyrevit():
     try:
         from pyrevit.loader import sessionmgr
@@ -203,15 +211,15 @@ def _autoreload_pyrevit():
         return True
     except Exception:
         pass
-    si = None
     try:
-        si = subprocess.STARTUPINFO(); si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-    except Exception:
-        pass
-    try:
-        subprocess.Popen(['pyrevit', 'reload'], startupinfo=si, shell=False); return True
+        subprocess.Popen(['pyrevit', 'reload'], startupinfo=_SI, shell=False); return True
     except Exception:
         pass
+    if _PYREVIT_EXE[0]:
+        try:
+            subprocess.Popen([_PYREVIT_EXE[0], 'reload'], startupinfo=_SI, shell=False); return True
+        except Exception:
+            pass
     appdata = os.environ.get('APPDATA') or ''
     localapp = os.environ.get('LOCALAPPDATA') or ''
     for exe in [
@@ -223,7 +231,8 @@ def _autoreload_pyrevit():
     ]:
         try:
             if os.path.exists(exe):
-                subprocess.Popen([exe, 'reload'], startupinfo=si, shell=False); return True
+                _PYREVIT_EXE[0] = exe
+                subprocess.Popen([exe, 'reload'], startupinfo=_SI, shell=False); return True
         except Exception:
             continue
     return False
@@ -302,11 +311,17 @@ class ShortcutManager(forms.WPFWindow):
 
     def refresh_remove_list(self, sender, args):
         try:
-            self.RemoveList.Items.Clear()
-            self._remove_map.clear()
-            for display, path in _list_existing_shortcuts_in_pulldowns():
-                self.RemoveList.Items.Add(display)
-                self._remove_map[display] = path
+            # defer layout until the whole list is rebuilt — one measure pass
+            # instead of one per Items.Add
+            self.RemoveList.BeginInit()
+            try:
+                self.RemoveList.Items.Clear()
+                self._remove_map.clear()
+                for display, path in _list_existing_shortcuts_in_pulldowns():
+                    self.RemoveList.Items.Add(display)
+                    self._remove_map[display] = path
+            finally:
+                self.RemoveList.EndInit()
         except Exception:
             pass
 
@@ -8,6 +8,7 @@ Requires a sibling file named 'ui.xaml' in the same folder.
 """
 from __future__ import print_function
 import os, clr
+from operator import attrgetter
 
 from Autodesk.Revit import DB
 from pyrevit import forms
@@ -17,9 +18,10 @@ clr.AddReference("System.Windows.Forms")
 from System.Windows.Forms import Clipboard
 
 # Data for binding
-clr.AddReference("System.Data")
-from System import String
-from System.Data import DataTable
+from System import Action, Object
+from System.Collections.Generic import List
+from System.Text import StringBuilder
+from System.Threading.Tasks import Task
 
 uiapp = __revit__
 uidoc = uiapp.ActiveUIDocument
@@ -30,53 +32,84 @@ if not uidoc:
 doc = uidoc.Document
 
 # --- pick the main model link ---
-links = list(DB.FilteredElementCollector(doc).OfClass(DB.RevitLinkInstance))
-if not links:
+# peek the collector instead of materializing it — the common single-link
+# case resolves from two next() calls with no list built
+_link_iter = iter(DB.FilteredElementCollector(doc).OfClass(DB.RevitLinkInstance))
+_first = next(_link_iter, None)
+if _first is None:
     forms.alert("No Revit links found in this model.")
     raise SystemExit
 
-if len(links) == 1:
-    link_inst = links[0]
+_second = next(_link_iter, None)
+if _second is None:
+    link_inst = _first
+    lnkdoc = link_inst.GetLinkDocument()
 else:
-    items = []
+    links = [_first, _second]
+    links.extend(_link_iter)
+    # name -> instance dict: O(1) recovery of the picked link, and the sort
+    # key is computed once per name instead of per comparison. The link
+    # documents fetched for the labels are kept (keyed by instance id) so
+    # the chosen link's document isn't re-fetched below.
+    _link_docs = {}
+    name_to_li = {}
     for li in links:
         ldoc = li.GetLinkDocument()
+        _link_docs[id(li)] = ldoc
         name = (ldoc.Title + " (loaded)") if ldoc else (li.Name + " (unloaded)")
-        items.append({"name": name, "li": li})
-    items.sort(key=lambda x: x["name"].lower())
-    picked = forms.SelectFromList.show([it["name"] for it in items],
+        name_to_li[name] = li
+    picked = forms.SelectFromList.show(sorted(name_to_li, key=str.lower),
                                        title="Pick the main model link",
                                        button_name="Use This Link",
                                        multiselect=False)
     if not picked:
         raise SystemExit
-    link_inst = [it["li"] for it in items if it["name"] == picked][0]
-
-lnkdoc = link_inst.GetLinkDocument()
+    link_inst = name_to_li[picked]
+    lnkdoc = _link_docs[id(link_inst)]
 if lnkdoc is None:
     forms.alert("Selected link is not loaded. Please load it and try again.")
     raise SystemExit
 
 # --- collect revisions from linked doc ---
-revs = list(DB.FilteredElementCollector(lnkdoc).OfClass(DB.Revision))
-revs.sort(key=lambda r: r.SequenceNumber)
+_ISSUED_ONLY = False   # flip to list only issued revisions
+
+# sorted() consumes the collector directly, and attrgetter skips a Python
+# frame per key extraction compared to a lambda
+coll = DB.FilteredElementCollector(lnkdoc).OfClass(DB.Revision)
+if _ISSUED_ONLY:
+    try:
+        # native parameter filter: unissued revisions are rejected inside
+        # the API and never marshal into Python
+        rule = DB.FilterIntegerRule(
+            DB.ParameterValueProvider(DB.ElementId(DB.BuiltInParameter.PROJECT_REVISION_ISSUED)),
+            DB.FilterNumericEquals(), 1)
+        coll = coll.WherePasses(DB.ElementParameterFilter(rule))
+        revs = sorted(coll, key=attrgetter("SequenceNumber"))
+    except Exception:
+        revs = sorted((r for r in coll if r.Issued), key=attrgetter("SequenceNumber"))
+else:
+    revs = sorted(coll, key=attrgetter("SequenceNumber"))
 
 if not revs:
     forms.alert("No revisions found in linked model: " + lnkdoc.Title)
     raise SystemExit
 
 # robustly read revision number across versions
+# resolve the enum members once — getattr across the CLR boundary per
+# revision is what made this loop hot
+_REV_BIPS = tuple(b for b in (getattr(DB.BuiltInParameter, n, None)
+                              for n in ("PROJECT_REVISION_REVISION_NUM",
+                                        "REVISION_NUMBER"))
+                  if b is not None)
 
 def get_rev_number(rev):
-    try:
-        num = rev.RevisionNumber
-        if num is not None:
-            return str(num)
-    except Exception:
-        pass
-    for bip_name in ("PROJECT_REVISION_REVISION_NUM", "REVISION_NUMBER"):
+    # common case first: RevisionNumber exists and is already a string —
+    # no exception frame per call, no redundant str() copy
+    num = getattr(rev, "RevisionNumber", None)
+    if num:
+        return num if isinstance(num, str) else str(num)
+    for bip in _REV_BIPS:
         try:
-            bip = getattr(DB.BuiltInParameter, bip_name)
             p = rev.get_Parameter(bip)
             if p:
                 s = p.AsString()
@@ -86,52 +119,115 @@ def get_rev_number(rev):
             pass
     return ""
 
-# build DataTable -> bind to DataGrid
-
-dt = DataTable("Revisions")
-dt.Columns.Add("Sequence", String)
-dt.Columns.Add("Number", String)
-dt.Columns.Add("Date", String)
-dt.Columns.Add("Description", String)
-
+# IMPORTANT: write the keys as escape sequences, not literal tab/CR/LF —
+# one translate pass replaces the control characters in the field values
+# instead of three chained .replace() allocations each
+_WS_TABLE = {ord(u"\t"): u" ", ord(u"\r"): u" ", ord(u"\n"): u" "}
+
+# build plain rows -> bind to DataGrid
+# The display is read-only, so DataTable's change tracking, RowState and
+# DataView indirection are dead weight; WPF resolves the column bindings
+# against these attributes through the DLR.
+
+class RevisionRow(object):
+    __slots__ = ('Sequence', 'Number', 'Date', 'Description')
+
+    def __init__(self, seq, num, date, desc):
+        self.Sequence = seq
+        self.Number = num
+        self.Date = date
+        self.Description = desc
+
+# capacity up front — the backing array never regrows — and the loop
+# invariants (Add, the scrub table) bound to locals once
+rows = List[Object](len(revs))
+_add = rows.Add
+_ws = _WS_TABLE
 for r in revs:
-    row = dt.NewRow()
-    row["Sequence"] = str(int(r.SequenceNumber))
-    row["Number"] = get_rev_number(r)
-    # IMPORTANT: use escaped sequences, not literal tab/CR/LF
-    row["Date"] = (r.RevisionDate or "").replace("\t", " ").replace("\r", " ").replace("\n", " ")
-    row["Description"] = (r.Description or "").replace("\t", " ").replace("\r", " ").replace("\n", " ")
-    dt.Rows.Add(row)
-
-# WPF window using pyRevit's WPFWindow wrapper
+    # SequenceNumber is already an Int32 — ToString() skips the Python
+    # int round trip of str(int(...))
+    _add(RevisionRow(r.SequenceNumber.ToString(),
+                     get_rev_number(r),
+                     (r.RevisionDate or u"").translate(_ws),
+                     (r.Description or u"").translate(_ws)))
+
+# WPF window using pyRevit's WPFWindow wrapper.
+# The XAML is slurped once into _XAML_TEXT and handed to WPFWindow as a
+# literal string, so the wrapper parses from memory instead of opening the
+# file itself (and a cached engine session reuses the read).
+_XAML_TEXT = [None]
+
+def _read_xaml(path):
+    if _XAML_TEXT[0] is None:
+        with open(path, 'r') as f:
+            _XAML_TEXT[0] = f.read()
+    return _XAML_TEXT[0]
+
 class RevWindow(forms.WPFWindow):
-    def __init__(self, xaml_path, link_doc, table):
+    def __init__(self, xaml_path, link_doc, rows):
         self._link_doc = link_doc
-        self._table = table
-        forms.WPFWindow.__init__(self, xaml_path)
+        self._rows = rows
+        try:
+            forms.WPFWindow.__init__(self, _read_xaml(xaml_path), literal_string=True)
+        except Exception:
+            # older pyrevit wrappers only take a path
+            forms.WPFWindow.__init__(self, xaml_path)
         # header
         self.TitleText.Text = "Linked model: {}".format(link_doc.Title)
-        # grid
-        self.RevGrid.ItemsSource = table.DefaultView
+        # grid — force row recycling before binding so a long revision
+        # history realizes only the visible containers, not all N rows
+        try:
+            from System.Windows.Controls import VirtualizingPanel, VirtualizationMode
+            VirtualizingPanel.SetIsVirtualizing(self.RevGrid, True)
+            VirtualizingPanel.SetVirtualizationMode(self.RevGrid, VirtualizationMode.Recycling)
+            self.RevGrid.EnableRowVirtualization = True
+            self.RevGrid.EnableColumnVirtualization = True
+        except Exception:
+            pass
+        # bind on Loaded rather than in the constructor: the window chrome
+        # appears immediately and the grid fills a frame later instead of
+        # making the user wait behind a synchronous measure/arrange
+        self.Loaded += self._on_loaded
         # buttons
         self.CloseBtn.Click += self._on_close
         self.CopyBtn.Click += self._on_copy
 
+    def _on_loaded(self, sender, args):
+        self.RevGrid.ItemsSource = self._rows
+
     def _on_close(self, sender, args):
         self.Close()
 
     def _on_copy(self, sender, args):
-        lines = ["Sequence\tNumber\tDate\tDescription"]
-        for row in self._table.Rows:
-            lines.append("{}	{}	{}	{}".format(row["Sequence"], row["Number"], row["Date"], row["Description"]))
-        try:
-            Clipboard.SetText("\n".join(lines))
+        # Build the TSV off the UI thread — with thousands of rows the walk
+        # would freeze the window. The row strings are immutable so the
+        # background read is safe; only Clipboard.SetText has to come back
+        # through the dispatcher (the clipboard is STA-bound).
+        rows = self._rows
+
+        def _set_text(text):
             try:
-                forms.toast("Copied to clipboard")
+                Clipboard.SetText(text)
+                try:
+                    forms.toast("Copied to clipboard")
+                except Exception:
+                    pass
             except Exception:
-                pass
-        except Exception:
-            forms.alert("Couldn't access clipboard. Select rows and press Ctrl+C.")
+                forms.alert("Couldn't access clipboard. Select rows and press Ctrl+C.")
+
+        def _build():
+            # capacity hint keeps the buffer from regrowing mid-walk
+            sb = StringBuilder(rows.Count * 80 + 64)
+            sb.Append("Sequence\tNumber\tDate\tDescription")
+            for row in rows:
+                sb.Append(u"\n").Append(row.Sequence).Append(u"\t")
+                sb.Append(row.Number).Append(u"\t")
+                sb.Append(row.Date).Append(u"\t")
+                sb.Append(row.Description)
+            text = sb.ToString()
+            self.Dispatcher.BeginInvoke(Action(lambda: _set_text(text)))
+
+        Task.Run(Action(_build))
 
 # locate XAML next to script
 xaml_path = os.path.join(os.path.dirname(__file__), 'ui.xaml')
@@ -140,4 +236,4 @@ if not os.path.exists(xaml_path):
     raise SystemExit
 
 # show
-RevWindow(xaml_path, lnkdoc, dt).ShowDialog()
\ No newline at end of file
+RevWindow(xaml_path, lnkdoc, rows).ShowDialog()
\ No newline at end of file
@@ -9,7 +9,7 @@
 # - Orders columns by sequence (SEQ 1, SEQ 2, …)
 # - Quick wait box with rotating messages
 
-import clr, os, io, json
+import clr, os, io, json, re
 
 # -------------------- INSTANT WAIT (WinForms) --------------------
 clr.AddReference('System.Windows.Forms')
@@ -157,6 +157,10 @@ VERT_DEFAULT_IN  = 0.5000   # vertical default width
 HORIZ_DEFAULT_IN = 2.0000   # horizontal default width
 
 GROUP_HEADER_DEFAULT = u"Revisions"       # Revit 2023+ only
+
+# bundle paths never change during a session — build them once
+_SCRIPT_DIR    = os.path.dirname(__file__)
+_SETTINGS_PATH = os.path.join(_SCRIPT_DIR, "_rev_dots_settings.json")
 # ------------------------------------------------
 
 # ----------------------- helpers ----------------
@@ -182,8 +186,7 @@ def ensure_shared_params_file():
     spf = app.SharedParametersFilename
     if spf and os.path.exists(spf):
         return app.OpenSharedParameterFile()
-    script_dir = os.path.dirname(__file__)
-    temp_spf = os.path.join(script_dir, "_rev_dots_sharedparams.txt")
+    temp_spf = os.path.join(_SCRIPT_DIR, "_rev_dots_sharedparams.txt")
     if not os.path.exists(temp_spf):
         with io.open(temp_spf, "w", encoding="utf-8") as f:
             f.write("# pyRevit Rev Dots shared parameters\n")
@@ -219,17 +222,23 @@ def ensure_sheet_param(def_file, param_name):
         pb.ReInsert(ext_def, binding, PARAM_GROUP)
 
 def find_or_create_sheetlist_schedule():
+    # hoisted out of the loop: the enum conversion and lowered hint are
+    # constant, and a hint match returns before the rest of the schedules
+    # are even enumerated
+    sheets_cat_id = int(BuiltInCategory.OST_Sheets)
+    hint = SCHEDULE_NAME_HINT.lower() if SCHEDULE_NAME_HINT else None
     cands = []
     for vs in FilteredElementCollector(doc).OfClass(ViewSchedule):
         try:
-            if vs.Definition and vs.Definition.CategoryId.IntegerValue == int(BuiltInCategory.OST_Sheets):
-                cands.append(vs)
+            d = vs.Definition
+            if not d or d.CategoryId.IntegerValue != sheets_cat_id:
+                continue
         except Exception:
-            pass
+            continue
+        if hint and hint in vs.Name.lower():
+            return vs
+        cands.append(vs)
     if cands:
-        for s in cands:
-            if SCHEDULE_NAME_HINT and SCHEDULE_NAME_HINT.lower() in s.Name.lower():
-                return s
         if len(cands) == 1:
             return cands[0]
         close_splash_safe()
@@ -251,13 +260,15 @@ def find_or_create_sheetlist_schedule():
     except Exception:
         return None
 
+def _field_index_map(sd):
+    """One pass over the schedule fields -> {name: index}. Every GetField
+    crosses the managed boundary, so callers needing several lookups consult
+    the dict instead of rescanning. (Rebuild after adding/removing fields —
+    indices shift.)"""
+    return dict((safe_get_name(sd.GetField(i)), i) for i in range(sd.GetFieldCount()))
+
 def schedule_has_field(schedule, field_name):
-    sd = schedule.Definition
-    for i in range(sd.GetFieldCount()):
-        f = sd.GetField(i)
-        if safe_get_name(f) == field_name:
-            return True
-    return False
+    return field_name in _field_index_map(schedule.Definition)
 
 def remove_field_from_schedule(schedule, field_name):
     sd = schedule.Definition
@@ -276,18 +287,16 @@ def remove_field_from_schedule(schedule, field_name):
 def add_field_to_schedule(schedule, field_name, column_heading=None, column_width_ft=None, heading_orientation="vertical"):
     sd = schedule.Definition
     target_field = None
+    fields_by_name = _field_index_map(sd)   # one scan serves both checks below
 
     for sf in sd.GetSchedulableFields():
         if safe_get_name(sf) != field_name:
             continue
-        if not schedule_has_field(schedule, field_name):
+        idx = fields_by_name.get(field_name)
+        if idx is None:
             target_field = sd.AddField(sf)
         else:
-            for i in range(sd.GetFieldCount()):
-                f = sd.GetField(i)
-                if safe_get_name(f) == field_name:
-                    target_field = f
-                    break
+            target_field = sd.GetField(idx)
         break
 
     if not target_field:
@@ -321,12 +330,6 @@ def add_field_to_schedule(schedule, field_name, column_heading=None, column_widt
 
     return True
 
-def set_sheet_text(sheet, name, value):
-    p = sheet.LookupParameter(name)
-    if p and p.AsString() != value:
-        p.Set(value)
-        return True
-    return False
 
 def parse_width_inches(text_in):
     s = (text_in or "").strip().lower()
@@ -342,9 +345,8 @@ def parse_width_inches(text_in):
         return None
 
 def try_load_logo(img_control):
-    folder = os.path.dirname(__file__)
     for name in ["logo.png", "logo.jpg", "logo.jpeg", "logo.bmp", "logo.ico"]:
-        path = os.path.join(folder, name)
+        path = os.path.join(_SCRIPT_DIR, name)
         if os.path.exists(path):
             try:
                 bi = BitmapImage()
@@ -359,18 +361,23 @@ def try_load_logo(img_control):
                 pass
     return False
 
+# matches 'SEQ 12' / 'SEQ 12 (2)' — the C matcher replaces a per-character
+# Python scan; called once per SEQ field on every reorder
+_SEQ_RE = re.compile(re.escape(PARAM_PREFIX) + r"\s*(\d+)")
+
+_seq_cache = {}   # name -> parsed sequence; pure, and the same names are
+                  # re-sorted on every Preview/Apply
+
 def seq_from_stable_name(stable_name):
-    try:
-        s = stable_name[len(PARAM_PREFIX):].strip()
-        num = []
-        for ch in s:
-            if ch.isdigit():
-                num.append(ch)
-            else:
-                break
-        return int(''.join(num)) if num else 10**9
-    except Exception:
-        return 10**9
+    v = _seq_cache.get(stable_name)
+    if v is None:
+        try:
+            m = _SEQ_RE.match(stable_name)
+            v = int(m.group(1)) if m else 10**9
+        except Exception:
+            v = 10**9
+        _seq_cache[stable_name] = v
+    return v
 
 def reorder_rev_fields(schedule, names_in_desired_order, headings_by_name, width_feet, heading_orientation):
     for name in names_in_desired_order:
@@ -379,35 +386,29 @@ def reorder_rev_fields(schedule, names_in_desired_order, headings_by_name, width
         heading = headings_by_name.get(name, name)
         add_field_to_schedule(schedule, name, column_heading=heading, column_width_ft=width_feet, heading_orientation=heading_orientation)
 
-def all_rev_project_param_names():
+def _scan_project_param_bindings():
+    """One ForwardIterator pass over doc.ParameterBindings ->
+    (names_set, defn_by_name) for our PARAM_PREFIX parameters. Each
+    MoveNext/.Name crosses into the API, so callers that need both the
+    name list and the definitions (orphan cleanup) share this single walk
+    instead of re-iterating per name."""
     names = set()
+    defn_by_name = {}
     try:
         pb = doc.ParameterBindings
         it = pb.ForwardIterator(); it.Reset()
         while it.MoveNext():
+            # Definition.Name is always a CLR string — direct access, no
+            # getattr reflection or type sniffing; the outer try covers a
+            # misbehaving definition
             defn = it.Key
-            nm = getattr(defn, "Name", "")
-            try:
-                is_str = isinstance(nm, basestring)
-            except:
-                is_str = isinstance(nm, str)
-            if is_str and nm.startswith(PARAM_PREFIX):
+            nm = defn.Name
+            if nm and nm.startswith(PARAM_PREFIX):
                 names.add(nm)
+                defn_by_name[nm] = defn
     except Exception:
         pass
-    return names
-
-def unbind_project_parameter_by_name(name):
-    try:
-        pb = doc.ParameterBindings
-        it = pb.ForwardIterator(); it.Reset()
-        while it.MoveNext():
-            defn = it.Key
-            if getattr(defn, "Name", "") == name:
-                return pb.Remove(defn)
-    except Exception:
-        pass
-    return False
+    return names, defn_by_name
 
 def make_heading_text(date_text, desc_text, mode_key, orient_key):
     d = (date_text or "").strip()
@@ -425,17 +426,23 @@ def make_heading_text(date_text, desc_text, mode_key, orient_key):
             return u"{} - {}".format(d, c)    # one line with hyphen
         return d or c
 
-# -------- Group/UnGroup for Revit 2023+ only (modern API) --------
-def _seq_column_bounds(schedule, prefix):
+def _field_names(schedule):
+    """Snapshot the schedule's field names as a tuple. One GetField pass
+    that callers share — each GetField + name reflection is an API
+    round-trip, so helpers take this snapshot instead of rescanning."""
     sd = schedule.Definition
-    seq_idxs = []
-    for i in range(sd.GetFieldCount()):
-        nm = safe_get_name(sd.GetField(i))
+    return tuple(safe_get_name(sd.GetField(i)) for i in range(sd.GetFieldCount()))
+
+# -------- Group/UnGroup for Revit 2023+ only (modern API) --------
+def _seq_column_bounds(field_names, prefix):
+    # single pass tracking min/max directly — no index list to build
+    lo = hi = None
+    for i, nm in enumerate(field_names):
         if isinstance(nm, str) and nm.startswith(prefix):
-            seq_idxs.append(i)
-    if not seq_idxs:
-        return None
-    return (min(seq_idxs), max(seq_idxs))
+            if lo is None:
+                lo = i
+            hi = i
+    return None if lo is None else (lo, hi)
 
 def _group_headers_modern(schedule, left, right, title):
     try:
@@ -444,11 +451,6 @@ def _group_headers_modern(schedule, left, right, title):
                 schedule.UngroupHeaders(0, left, 0, right)
             except Exception:
                 pass
-        if hasattr(schedule, "CanGroupHeaders") and not schedule.CanGroupHeaders(0, left, 0, right):
-            try:
-                doc.Regenerate()
-            except Exception:
-                pass
         schedule.GroupHeaders(0, left, 0, right, title)
         return True
     except Exception:
@@ -463,47 +465,44 @@ def _ungroup_headers_modern(schedule, left, right):
         pass
     return False
 
-def group_rev_headers(schedule, prefix, title):
+def group_rev_headers(schedule, prefix, title, field_names=None):
     # 2023+: use modern API; 2022 will simply return False
     try:
         if not hasattr(schedule, "GroupHeaders"):
             return False
-        bounds = _seq_column_bounds(schedule, prefix)
+        if field_names is None:
+            field_names = _field_names(schedule)
+        bounds = _seq_column_bounds(field_names, prefix)
         if not bounds:
             return False
         left, right = bounds
-        try:
-            doc.Regenerate()
-        except Exception:
-            pass
         return _group_headers_modern(schedule, left, right, title)
     except Exception:
         return False
 
-def ungroup_rev_headers(schedule, prefix):
+def ungroup_rev_headers(schedule, prefix, field_names=None):
     try:
         if not hasattr(schedule, "UngroupHeaders"):
             return False
-        bounds = _seq_column_bounds(schedule, prefix)
+        if field_names is None:
+            field_names = _field_names(schedule)
+        bounds = _seq_column_bounds(field_names, prefix)
         if not bounds:
             return False
         left, right = bounds
-        try:
-            doc.Regenerate()
-        except Exception:
-            pass
         return _ungroup_headers_modern(schedule, left, right)
     except Exception:
         return False
 
 # ---------------- Settings (persist across runs) ----------------
 def _settings_path():
-    return os.path.join(os.path.dirname(__file__), "_rev_dots_settings.json")
+    return _SETTINGS_PATH
 
 def load_settings():
     try:
+        # slurp + loads instead of streaming json.load — one read call
         with io.open(_settings_path(), "r", encoding="utf-8") as f:
-            return json.load(f)
+            return json.loads(f.read())
     except Exception:
         return {}
 
@@ -516,8 +515,13 @@ def save_settings(mode_key, orient_key, width_in, group_enabled, group_title):
             "group_enabled": bool(group_enabled),
             "group_title": group_title or GROUP_HEADER_DEFAULT
         }
+        # serialize first, then one write — json.dump issues a flurry of
+        # tiny writes through the file object
+        payload = json.dumps(data, ensure_ascii=False)
+        if not isinstance(payload, type(u"")):
+            payload = payload.decode("utf-8")   # py2: all-ASCII dumps returns str
         with io.open(_settings_path(), "w", encoding="utf-8") as f:
-            json.dump(data, f)
+            f.write(payload)
     except Exception:
         pass
 
@@ -567,64 +571,124 @@ try:
 
     _splash.set_status("Building revision list…")
     entries = []  # (stable_name, rev_id, date_text, desc_text)
-    seen = set()
+    count_by_seq = {}  # duplicates resolved with one dict hit, no probe loop
     for r in revs:
-        stable_name = u"{}{}".format(PARAM_PREFIX, r.SequenceNumber)
-        i = 2
-        while stable_name in seen:
-            stable_name = u"{}{} ({})".format(PARAM_PREFIX, r.SequenceNumber, i); i += 1
-        seen.add(stable_name)
+        n = r.SequenceNumber
+        k = count_by_seq.get(n, 0)
+        count_by_seq[n] = k + 1
+        if k == 0:
+            stable_name = u"{}{}".format(PARAM_PREFIX, n)
+        else:
+            stable_name = u"{}{} ({})".format(PARAM_PREFIX, n, k + 1)
 
         date_text = (getattr(r, "RevisionDate", "") or "").strip()
         desc_text = (getattr(r, "Description", "") or "").strip()
         entries.append((stable_name, r.Id, date_text, desc_text))
 
+    # entries never changes after PREP — build the name set once for every
+    # Preview/Apply (frozen so accidental mutation raises)
+    _CURRENT_REV_STABLE_NAMES = frozenset(st for (st, _rid, _d, _c) in entries)
+
 finally:
     pass
 
 # ---------- helpers that depend on schedule/entries ----------
-def current_existing_names(schedule, entries):
-    names = set()
-    sd = schedule.Definition
-    existing = set()
-    for i in range(sd.GetFieldCount()):
-        existing.add(safe_get_name(sd.GetField(i)))
-    for (stable_name, _rid, _d, _c) in entries:
-        if stable_name in existing:
-            names.add(stable_name)
-    return names
+def current_existing_names(field_names, entries):
+    existing = set(field_names)
+    return set(st for (st, _rid, _d, _c) in entries if st in existing)
+
+_last_group_state = [None]   # (enabled, title) applied this session — grouping
+                             # isn't cheaply queryable from the schedule
 
 def perform_update(checked_names, mode_key, orient_key, width_inches, group_enabled, group_title, show_alert=True):
     width_feet = float(width_inches) / 12.0
-    existing_now = current_existing_names(schedule, entries)
+    existing_now = current_existing_names(_field_names(schedule), entries)
     to_show = set(checked_names)
     to_hide = existing_now - to_show
 
-    def make_heading(date_text, desc_text):
-        return make_heading_text(date_text, desc_text, mode_key, orient_key)
-    parts = {st: (rid, d, c) for (st, rid, d, c) in entries}
-    headings_by_name = {st: make_heading(d, c) for st, (rid, d, c) in parts.items()}
-
-    current_rev_stable_names = set(st for (st, _rid, _d, _c) in entries)
-    project_rev_param_names = all_rev_project_param_names()
-    orphan_param_names = sorted(list(project_rev_param_names - current_rev_stable_names), key=seq_from_stable_name)
+    # one pass over entries fills both dicts (no intermediate items() walk)
+    parts = {}
+    headings_by_name = {}
+    for st, rid, d, c in entries:
+        parts[st] = (rid, d, c)
+        headings_by_name[st] = make_heading_text(d, c, mode_key, orient_key)
+
+    project_rev_param_names, rev_defn_by_name = _scan_project_param_bindings()
+    orphan_param_names = sorted(list(project_rev_param_names - _CURRENT_REV_STABLE_NAMES), key=seq_from_stable_name)
+
+    # No-op fast path: a re-Apply with nothing changed otherwise still pays
+    # for a transaction commit + regen + a walk over every sheet. Dirty if
+    # any field comes or goes, an orphan is pending, a live heading/width
+    # differs, or the grouping choice changed since the last apply this run.
+    dirty = bool(orphan_param_names) or bool(to_hide) or bool(to_show - existing_now)
+    if not dirty and (bool(group_enabled), group_title or GROUP_HEADER_DEFAULT) != _last_group_state[0]:
+        dirty = True
+    if not dirty and to_show:
+        sd = schedule.Definition
+        idx_by_name = _field_index_map(sd)
+        want_orient = None
+        if ScheduleHeadingOrientation:
+            want_orient = (ScheduleHeadingOrientation.Horizontal
+                           if orient_key == "horizontal"
+                           else ScheduleHeadingOrientation.Vertical)
+        for st in to_show:
+            idx = idx_by_name.get(st)
+            try:
+                f = sd.GetField(idx)
+                if (f.ColumnHeading != headings_by_name.get(st, st)
+                        or abs(f.GridColumnWidth - width_feet) > 1e-9
+                        or (want_orient is not None
+                            and f.HeadingOrientation != want_orient)):
+                    dirty = True
+                    break
+            except Exception:
+                dirty = True
+                break
+    if not dirty:
+        if show_alert:
+            forms.toast("No changes to apply.",
+                        title="Sheet Index Revision Dots",
+                        appid="Sheet Index Revision Dots")
+        return True
 
     t = Transaction(doc, "Sheet Index Revision Dots — Apply")
     deleted_params = hidden = updated = 0
     try:
         t.Start()
 
-        for pname in orphan_param_names:
-            remove_field_from_schedule(schedule, pname)
-            if unbind_project_parameter_by_name(pname):
-                deleted_params += 1
+        # one try around the whole orphan sweep, not one per iteration —
+        # per-loop exception frames add up and a bindings failure here is
+        # not worth continuing past
+        try:
+            pb = doc.ParameterBindings
+            for pname in orphan_param_names:
+                remove_field_from_schedule(schedule, pname)
+                if pb.Remove(rev_defn_by_name[pname]):
+                    deleted_params += 1
+        except Exception:
+            # silent like the baseline — anything left over is still an
+            # orphan and gets retried on the next apply
+            pass
 
         for stable_name in to_hide:
             if remove_field_from_schedule(schedule, stable_name):
                 hidden += 1
 
+        # Only mutate what actually changed: fields new to the schedule get
+        # added; ones already present have heading/width/orientation patched
+        # in place (each definition mutation costs a regen + undo entry).
+        to_add  = to_show - existing_now
+        to_keep = to_show & existing_now
+
+        # ensure_sheet_param hits the shared-params file and the bindings
+        # map — skip it for names already bound (after the first run that
+        # is all of them); orphans were just unbound, so they don't count
+        already_bound = project_rev_param_names.difference(orphan_param_names)
         for stable_name in to_show:
-            ensure_sheet_param(def_file, stable_name)
+            if stable_name not in already_bound:
+                ensure_sheet_param(def_file, stable_name)
+
+        for stable_name in to_add:
             add_field_to_schedule(
                 schedule,
                 stable_name,
@@ -633,38 +697,86 @@ def perform_update(checked_names, mode_key, orient_key, width_inches, group_enab
                 heading_orientation=orient_key
             )
 
-        ordered_names = sorted(list(to_show), key=seq_from_stable_name)
+        if to_keep:
+            sd = schedule.Definition
+            idx_by_name = _field_index_map(sd)
+            want_orient = None
+            if ScheduleHeadingOrientation:
+                want_orient = (ScheduleHeadingOrientation.Horizontal
+                               if orient_key == "horizontal"
+                               else ScheduleHeadingOrientation.Vertical)
+            for stable_name in to_keep:
+                idx = idx_by_name.get(stable_name)
+                if idx is None:
+                    continue
+                f = sd.GetField(idx)
+                heading = headings_by_name.get(stable_name, stable_name)
+                try:
+                    if f.ColumnHeading != heading:
+                        f.ColumnHeading = heading
+                    if abs(f.GridColumnWidth - width_feet) > 1e-9:
+                        f.GridColumnWidth = width_feet
+                    if want_orient is not None and f.HeadingOrientation != want_orient:
+                        f.HeadingOrientation = want_orient
+                except Exception:
+                    pass
+
+        ordered_names = sorted(to_show, key=seq_from_stable_name)
         if ordered_names:
-            reorder_rev_fields(schedule, ordered_names, headings_by_name, width_feet, orient_key)
+            # the remove/re-add shuffle is only worth it when the columns
+            # are actually out of order
+            current_order = [nm for nm in _field_names(schedule) if nm in to_show]
+            if current_order != ordered_names:
+                reorder_rev_fields(schedule, ordered_names, headings_by_name, width_feet, orient_key)
 
         if to_show:
-            all_sheets = list(FilteredElementCollector(doc).OfClass(ViewSheet))
-            for sh in all_sheets:
+            # flatten (name, revision id int) once — the sheet loop repeats
+            # per sheet, so the parts[] lookups and .IntegerValue calls
+            # don't belong inside it
+            to_show_items = [(st, parts[st][0].IntegerValue) for st in to_show]
+            # iterate the collector directly — no need to materialize every
+            # sheet up front, and the type filter runs on the native side
+            sheets_iter = FilteredElementCollector(doc).OfClass(ViewSheet).WhereElementIsNotElementType()
+            for sh in sheets_iter:
                 try:
                     rev_ids = set(rid.IntegerValue for rid in sh.GetAllRevisionIds())
                 except Exception:
                     rev_ids = set()
-                for stable_name in to_show:
-                    rid, d, c = parts[stable_name]
-                    val = DOT if rid.IntegerValue in rev_ids else ""
-                    if set_sheet_text(sh, stable_name, val):
+                # inline the cell write: one LookupParameter per cell, and
+                # Set only when the value actually changes (no-op writes
+                # still go through the undo/journal machinery)
+                for stable_name, int_id in to_show_items:
+                    p = sh.LookupParameter(stable_name)
+                    if p is None or p.IsReadOnly:
+                        continue
+                    val = DOT if int_id in rev_ids else ""
+                    if p.AsString() != val:
+                        p.Set(val)
                         updated += 1
 
         # Group or ungroup (only works on Revit 2023+)
+        # Single regen for the whole apply — the grouping helpers no longer
+        # regen on their own, and Regenerate is a whole-model recompute we
+        # only pay when a schedule field actually changed.
+        if orphan_param_names or to_hide or to_show:
+            try:
+                doc.Regenerate()
+            except Exception:
+                pass
         try:
-            doc.Regenerate()
-        except Exception:
-            pass
-        try:
+            # fields are settled at this point — snapshot names once for the
+            # grouping helpers instead of rescanning inside each
+            names_now = _field_names(schedule)
             if group_enabled and to_show:
-                group_rev_headers(schedule, prefix=PARAM_PREFIX, title=(group_title or GROUP_HEADER_DEFAULT))
+                group_rev_headers(schedule, prefix=PARAM_PREFIX, title=(group_title or GROUP_HEADER_DEFAULT), field_names=names_now)
             else:
                 # user turned grouping off -> ungroup if currently grouped (2023+ only)
-                ungroup_rev_headers(schedule, prefix=PARAM_PREFIX)
+                ungroup_rev_headers(schedule, prefix=PARAM_PREFIX, field_names=names_now)
         except Exception:
             pass
 
         t.Commit()
+        _last_group_state[0] = (bool(group_enabled), group_title or GROUP_HEADER_DEFAULT)
         if show_alert:
             forms.toast(
                 "Applied — Shown: {} | Hidden: {} | Updated cells: {} | Deleted params: {}\nWidth: {:.4f}\"  Orientation: {}  Grouped: {}".format(
@@ -687,10 +799,17 @@ def perform_update(checked_names, mode_key, orient_key, width_inches, group_enab
 # -------------------- Main UI wrapper (uses your ui.xaml) --------------------
 class RevDotsUI(forms.WPFWindow):
     """Width resets to DEFAULT only when the user changes orientation."""
+    # combo item order is fixed in ui.xaml — index lookup beats pulling the
+    # item Content string and substring-matching it on every read
+    _MODE_BY_IDX   = {0: "both", 1: "date", 2: "desc"}
+    _ORIENT_BY_IDX = {0: "vertical", 1: "horizontal"}
+
     def __init__(self, xaml_path, ui_items, start_width_in, default_mode, default_orient, default_group_enabled, default_group_title):
         forms.WPFWindow.__init__(self, xaml_path)
         self.result = None
         self._last_clicked_index = None  # <-- anchor for Shift-click ranges
+        self._checkboxes = []            # Python-side mirror of RevList.Items
+                                         # (skips the WPF indexer on bulk ops)
         self._vert_default_str  = "{:.4f}".format(VERT_DEFAULT_IN)
         self._horiz_default_str = "{:.4f}".format(HORIZ_DEFAULT_IN)
         self._suppress_orient_event = True
@@ -751,38 +870,50 @@ class RevDotsUI(forms.WPFWindow):
         except:
             pass
 
-        # Populate list (now with Shift-click range selection)
+        # Populate list (now with Shift-click range selection).
+        # Build the checkboxes first, then add inside BeginInit/EndInit so
+        # WPF lays the ItemsControl out once instead of per insertion.
+        # Tag carries (stable_name, index) so one shared Click handler
+        # serves every checkbox — no closure + delegate pair per item.
         for idx, it in enumerate(ui_items):
             cb = CheckBox()
             cb.Content = it["label"]
-            cb.Tag = it["stable"]
+            cb.Tag = (it["stable"], idx)
             cb.Margin = Thickness(0, 3, 0, 3)
             cb.IsChecked = it["checked"]
             if it["checked"]:
                 cb.Foreground = Brushes.DimGray
-            self.RevList.Items.Add(cb)
-
-            # --- Shift-click range selection ---
-            def _make_click(idx_local, cb_local):
-                def _on_click(sender, args):
-                    try:
-                        shift_down = (Keyboard.Modifiers & ModifierKeys.Shift) == ModifierKeys.Shift
-                    except:
-                        shift_down = False
-
-                    if shift_down and self._last_clicked_index is not None:
-                        start = min(self._last_clicked_index, idx_local)
-                        end   = max(self._last_clicked_index, idx_local)
-                        new_state = bool(cb_local.IsChecked)  # apply clicked state to the whole range
-                        for j in range(start, end + 1):
-                            item_cb = self.RevList.Items[j]
-                            item_cb.IsChecked = new_state
-
-                    # anchor for the next shift-range
-                    self._last_clicked_index = idx_local
-                return _on_click
-
-            cb.Click += _make_click(idx, cb)
+            cb.Click += self._on_item_click
+            self._checkboxes.append(cb)
+
+        items = self.RevList.Items
+        can_defer = hasattr(items, "BeginInit")
+        if can_defer:
+            items.BeginInit()
+        try:
+            for cb in self._checkboxes:
+                items.Add(cb)
+        finally:
+            if can_defer:
+                items.EndInit()
+
+    def _on_item_click(self, sender, args):
+        # --- Shift-click range selection ---
+        _stable, idx = sender.Tag
+        try:
+            shift_down = (Keyboard.Modifiers & ModifierKeys.Shift) == ModifierKeys.Shift
+        except:
+            shift_down = False
+
+        if shift_down and self._last_clicked_index is not None:
+            start = min(self._last_clicked_index, idx)
+            end   = max(self._last_clicked_index, idx)
+            new_state = bool(sender.IsChecked)  # apply clicked state to the whole range
+            for item_cb in self._checkboxes[start:end + 1]:
+                item_cb.IsChecked = new_state
+
+        # anchor for the next shift-range
+        self._last_clicked_index = idx
 
     def on_group_toggle(self, sender, args):
         try:
@@ -802,32 +933,24 @@ class RevDotsUI(forms.WPFWindow):
             pass
 
     def on_check_all(self, sender, args):
-        for i in range(self.RevList.Items.Count):
-            cb = self.RevList.Items[i]
+        for cb in self._checkboxes:
             cb.IsChecked = True
 
     def on_check_none(self, sender, args):
-        for i in range(self.RevList.Items.Count):
-            cb = self.RevList.Items[i]
+        for cb in self._checkboxes:
             cb.IsChecked = False
 
     def _read_heading_mode(self):
         try:
-            txt = self.HeadingModeBox.SelectedItem.Content.ToString().lower()
+            return self._MODE_BY_IDX.get(self.HeadingModeBox.SelectedIndex, "both")
         except Exception:
             return "both"
-        if "date only" in txt:         return "date"
-        if "description only" in txt:  return "desc"
-        return "both"
 
     def _read_orientation(self):
         try:
-            txt = self.OrientationBox.SelectedItem.Content.ToString().lower()
+            return self._ORIENT_BY_IDX.get(self.OrientationBox.SelectedIndex, "vertical")
         except Exception:
             return "vertical"
-        if "horizontal" in txt:
-            return "horizontal"
-        return "vertical"
 
     def _read_grouping(self):
         try:
@@ -841,12 +964,7 @@ class RevDotsUI(forms.WPFWindow):
         return enabled, title
 
     def _current_checked(self):
-        checked = []
-        for i in range(self.RevList.Items.Count):
-            cb = self.RevList.Items[i]
-            if bool(cb.IsChecked):
-                checked.append(cb.Tag)
-        return checked
+        return [cb.Tag[0] for cb in self._checkboxes if cb.IsChecked]
 
     def _current_width_inches(self):
         width_in = parse_width_inches(self.WidthBox.Text)
@@ -887,7 +1005,7 @@ class RevDotsUI(forms.WPFWindow):
 # ------------------------ SHOW MAIN UI ----------------------------
 existing_names = set()
 try:
-    existing_names = current_existing_names(schedule, entries)
+    existing_names = current_existing_names(_field_names(schedule), entries)
 except:
     existing_names = set()
 
@@ -899,7 +1017,7 @@ for (stable_name, rid, d, c) in entries:
 
 close_splash_safe()
 
-xaml_path = os.path.join(os.path.dirname(__file__), "ui.xaml")
+xaml_path = os.path.join(_SCRIPT_DIR, "ui.xaml")
 dlg = RevDotsUI(
     xaml_path, ui_items,
     default_width_in, default_mode, default_orient,